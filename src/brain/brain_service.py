@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
 from pathlib import Path
 
@@ -33,7 +34,9 @@ def build_services(logger: logging.Logger | None = None) -> MinuteScheduler:
         delay_ms=settings.FINNHUB_REQUEST_DELAY_MS,
         max_symbols_per_minute=settings.FINNHUB_MAX_SYMBOLS_PER_MINUTE,
         max_symbols_per_second=settings.FINNHUB_MAX_SYMBOLS_PER_SECOND,
+        min_ttl_seconds=settings.FINNHUB_QUOTE_CACHE_TTL_SECONDS,
     )
+    atexit.register(buy_data.close)  # release the fetch pool and pooled connections on shutdown
     fill_data = buy_data  # Use Finnhub for fills; broker will use bid/ask pre-open and high after open
     app_logger.info("Using FinnhubMarketDataProvider for buys and fills")
 
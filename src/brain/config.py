@@ -56,6 +56,11 @@ class Settings(BaseSettings):
         description="Max symbols to request per second from Finnhub.",
         ge=1,
     )
+    FINNHUB_QUOTE_CACHE_TTL_SECONDS: float = Field(
+        default=2.0,
+        description="Reuse a fetched Finnhub quote for this many seconds (0 disables caching).",
+        ge=0,
+    )
     YFINANCE_CACHE_TTL_SECONDS: int = Field(
         default=300,
         description="How long to cache yfinance 5m bars (seconds).",
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 import requests
 from bs4 import BeautifulSoup
@@ -19,6 +20,38 @@ def _is_valid_symbol(text: str) -> bool:
     return bool(_SYMBOL_PATTERN.fullmatch(text))
 
 
+def _extract_symbols(html: str) -> Tuple[str, ...]:
+    """
+    Pull valid ticker symbols out of screener HTML, sorted and de-duplicated.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    symbols = set()
+
+    # Primary: pull only the ticker cell anchors (tab-link) from the screener grid.
+    grid_rows = soup.select("table.screener_table tr.styled-row, table.screener-view-table tr.styled-row")
+    for row in grid_rows:
+        ticker_cell = row.select_one("a.tab-link")
+        if ticker_cell:
+            text = ticker_cell.get_text(strip=True).upper()
+            if _is_valid_symbol(text):
+                symbols.add(text)
+
+    # Fallback: if none found (HTML variant), try anchors inside screener tables but still require validity.
+    if not symbols:
+        screener_tables = soup.select("table.screener-view-table, table.screener-table")
+        for table in screener_tables:
+            for anchor in table.find_all("a", href=_ANCHOR_PATTERN):
+                text = anchor.get_text(strip=True).upper()
+                if _is_valid_symbol(text):
+                    symbols.add(text)
+
+    return tuple(sorted(symbols))
+
+
+# Injected HTML (tests, replays) is often parsed repeatedly; live fetches bypass this cache.
+_extract_symbols_cached = lru_cache(maxsize=32)(_extract_symbols)
+
+
 class FinvizScreenerClient:
     """
     Lightweight Finviz Elite screener client. All scraping logic is contained here
@@ -39,35 +72,15 @@ class FinvizScreenerClient:
             headers["Cookie"] = self.cookie
         response = self.session.get(self.url, headers=headers, timeout=15)
         response.raise_for_status()
-        self.logger.debug("Fetched screener HTML (%s bytes)", len(response.text))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Fetched screener HTML (%s bytes)", len(response.text))
         return response.text
 
-    def parse_symbols(self, html: str) -> List[str]:
-        soup = BeautifulSoup(html, "lxml")
-        symbols = set()
-
-        # Primary: pull only the ticker cell anchors (tab-link) from the screener grid.
-        grid_rows = soup.select("table.screener_table tr.styled-row, table.screener-view-table tr.styled-row")
-        for row in grid_rows:
-            ticker_cell = row.select_one("a.tab-link")
-            if ticker_cell:
-                text = ticker_cell.get_text(strip=True).upper()
-                if _is_valid_symbol(text):
-                    symbols.add(text)
-
-        # Fallback: if none found (HTML variant), try anchors inside screener tables but still require validity.
-        if not symbols:
-            screener_tables = soup.select("table.screener-view-table, table.screener-table")
-            for table in screener_tables:
-                for anchor in table.find_all("a", href=_ANCHOR_PATTERN):
-                    text = anchor.get_text(strip=True).upper()
-                    if _is_valid_symbol(text):
-                        symbols.add(text)
-
-        parsed = sorted(symbols)
+    def parse_symbols(self, html: str, use_cache: bool = False) -> List[str]:
+        parsed = list(_extract_symbols_cached(html) if use_cache else _extract_symbols(html))
         if not parsed:
             self.logger.warning("Parsed 0 symbols from screener HTML")
-        else:
+        elif self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug("Parsed %d symbols from screener", len(parsed))
         return parsed
 
@@ -75,5 +88,6 @@ class FinvizScreenerClient:
         """
         Fetch and parse the screener page. `html` can be injected for testing.
         """
-        raw_html = html if html is not None else self.fetch_html()
-        return self.parse_symbols(raw_html)
+        if html is not None:
+            return self.parse_symbols(html, use_cache=True)
+        return self.parse_symbols(self.fetch_html())
@@ -3,9 +3,9 @@ from __future__ import annotations
 import datetime as dt
 import uuid
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 Symbol = str
 
@@ -45,6 +45,13 @@ class Quote(BaseModel):
 
 
 class Order(BaseModel):
+    """
+    Immutable order record. Status changes produce a new instance via `with_status`,
+    so brokers and the state store can share instances without defensive deep copies.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     symbol: Symbol
     side: OrderSide
@@ -54,11 +61,10 @@ class Order(BaseModel):
     status: OrderStatus = OrderStatus.NEW
     created_at: dt.datetime = Field(default_factory=lambda: dt.datetime.now(dt.timezone.utc))
     updated_at: dt.datetime = Field(default_factory=lambda: dt.datetime.now(dt.timezone.utc))
-    tags: List[str] = Field(default_factory=list)
+    tags: Tuple[str, ...] = ()
 
-    def mark_status(self, status: OrderStatus) -> None:
-        self.status = status
-        self.updated_at = dt.datetime.now(dt.timezone.utc)
+    def with_status(self, status: OrderStatus) -> "Order":
+        return self.model_copy(update={"status": status, "updated_at": dt.datetime.now(dt.timezone.utc)})
 
 
 class Fill(BaseModel):
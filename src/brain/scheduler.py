@@ -6,7 +6,7 @@ import datetime as dt
 from typing import Callable
 
 from .config import Settings
-from ..shared.time_utils import is_within_trading_hours, now
+from ..shared.time_utils import make_session_check, now
 
 
 class MinuteScheduler:
@@ -21,6 +21,11 @@ class MinuteScheduler:
         self._stop_event = asyncio.Event()
         self._eod_callback: Callable[[], None] | None = None
         self._eod_done_date: str | None = None
+        self._in_session = make_session_check(
+            settings.PREMARKET_START,
+            settings.REGULAR_CLOSE,
+            allow_weekends=settings.ALLOW_WEEKEND_TRADING,
+        )
 
     def set_eod_callback(self, fn: Callable[[], None]) -> None:
         self._eod_callback = fn
@@ -29,13 +34,7 @@ class MinuteScheduler:
         self.logger.info("Starting minute scheduler (interval=%ss)", self.settings.REFRESH_INTERVAL_SECONDS)
         while not self._stop_event.is_set():
             current = now(self.settings.TIMEZONE)
-            if is_within_trading_hours(
-                current,
-                self.settings.PREMARKET_START,
-                self.settings.REGULAR_OPEN,
-                self.settings.REGULAR_CLOSE,
-                allow_weekends=self.settings.ALLOW_WEEKEND_TRADING,
-            ):
+            if self._in_session(current):
                 self.logger.info("Tick at %s", current)
                 try:
                     self.tick()
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import json
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import logging
 
-from .models import Fill, Order, OrderStatus, Position
+from .models import Fill, Order, OrderSide, OrderStatus, Position
+
+_OPEN_STATUSES = frozenset({OrderStatus.NEW, OrderStatus.WORKING})
 
 
 class JsonStateStore:
@@ -19,6 +22,10 @@ class JsonStateStore:
         self.positions: Dict[str, Position] = {}
         self.orders: Dict[str, Order] = {}
         self.fills: Dict[str, Fill] = {}
+        # Insertion-ordered (dict as ordered set) so open orders come back in placement order.
+        self._open_order_ids: Dict[str, None] = {}
+        self._batch_depth = 0
+        self._dirty = False
         self._load()
 
     def _load(self) -> None:
@@ -30,6 +37,7 @@ class JsonStateStore:
         self.positions = {sym: Position.model_validate(pos) for sym, pos in data.get("positions", {}).items()}
         self.orders = {oid: Order.model_validate(ord_) for oid, ord_ in data.get("orders", {}).items()}
         self.fills = {fid: Fill.model_validate(fill) for fid, fill in data.get("fills", {}).items()}
+        self._open_order_ids = {oid: None for oid, order in self.orders.items() if order.status in _OPEN_STATUSES}
         self.logger.info(
             "Loaded state: %d positions, %d orders, %d fills",
             len(self.positions),
@@ -45,25 +53,61 @@ class JsonStateStore:
             "fills": {fid: fill.model_dump(mode="json") for fid, fill in self.fills.items()},
         }
         self.path.write_text(json.dumps(payload, indent=2))
+        self._dirty = False
+
+    def _save(self) -> None:
+        """
+        Persist now, or mark dirty if inside a `batch()` block.
+        """
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._persist()
+
+    @contextmanager
+    def batch(self) -> Iterator["JsonStateStore"]:
+        """
+        Defer persistence until the outermost block exits, writing the file once.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._persist()
 
     def get_open_positions(self) -> Dict[str, Position]:
         return {sym: pos for sym, pos in self.positions.items() if not pos.closed}
 
     def upsert_position(self, position: Position) -> None:
         self.positions[position.symbol] = position
-        self._persist()
+        self._save()
 
     def upsert_order(self, order: Order) -> None:
         self.orders[order.id] = order
-        self._persist()
+        if order.status in _OPEN_STATUSES:
+            self._open_order_ids[order.id] = None
+        else:
+            self._open_order_ids.pop(order.id, None)
+        self._save()
 
     def record_fill(self, fill: Fill) -> None:
         self.fills[fill.id] = fill
-        self._persist()
+        self._save()
 
     def get_orders_by_status(self, status: OrderStatus) -> List[Order]:
         return [order for order in self.orders.values() if order.status == status]
 
+    def get_open_orders(self, side: Optional[OrderSide] = None) -> List[Order]:
+        """
+        Return NEW/WORKING orders using the open-order index instead of scanning all history.
+        """
+        open_orders = [self.orders[oid] for oid in self._open_order_ids]
+        if side is None:
+            return open_orders
+        return [order for order in open_orders if order.side == side]
+
     def get_order(self, order_id: str) -> Optional[Order]:
         return self.orders.get(order_id)
 
@@ -71,4 +115,5 @@ class JsonStateStore:
         self.positions.clear()
         self.orders.clear()
         self.fills.clear()
-        self._persist()
+        self._open_order_ids.clear()
+        self._save()
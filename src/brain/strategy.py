@@ -44,85 +44,99 @@ class Strategy:
         self.broker = broker
         self.state_store = state_store
         self.logger = logger or logging.getLogger(__name__)
-        self.pnl_logger = PnLLogger(settings.PNL_LOG_FILE, logger=self.logger)
+        self.pnl_logger = PnLLogger(settings.PNL_LOG_FILE, logger=self.logger, tz=settings.TIMEZONE)
         self._eod_done_date: str | None = None
 
     def run_tick(self) -> None:
-        screener_symbols = self.screener.get_symbols()
-        positions = self.state_store.get_open_positions()
-        pending_buys = {
-            order.symbol
-            for order in self.state_store.orders.values()
-            if order.side == OrderSide.BUY and order.status in {OrderStatus.NEW, OrderStatus.WORKING}
-        }
+        with self.state_store.batch():
+            screener_symbols = self.screener.get_symbols()
+            open_orders = self.state_store.get_open_orders()
+            if not screener_symbols and not open_orders:
+                return
 
-        buy_candidates = [sym for sym in screener_symbols if sym not in positions and sym not in pending_buys]
+            positions = self.state_store.get_open_positions()
+            pending_buys = {order.symbol for order in open_orders if order.side == OrderSide.BUY}
 
-        open_order_symbols = [
-            order.symbol
-            for order in self.state_store.orders.values()
-            if order.status in {OrderStatus.NEW, OrderStatus.WORKING}
-        ]
+            buy_candidates = [sym for sym in screener_symbols if sym not in positions and sym not in pending_buys]
 
-        buy_quotes: Dict[str, Quote] = {}
-        placed_symbols: Set[str] = set()
-        if buy_candidates:
-            buy_quotes = self.buy_data.get_quotes(buy_candidates)
-            placed_symbols = self._place_buys(buy_candidates, buy_quotes)
+            open_order_symbols = [order.symbol for order in open_orders]
 
-        fill_quotes: Dict[str, Quote] = {}
-        if open_order_symbols:
-            fill_quotes = self.fill_data.get_quotes(open_order_symbols)
+            # Quiet tick: nothing new to buy and nothing resting, so skip the quote round-trips.
+            if not buy_candidates and not open_order_symbols:
+                return
 
-        combined_quotes = dict(fill_quotes)
-        combined_quotes.update({sym: buy_quotes[sym] for sym in placed_symbols if sym in buy_quotes})
+            buy_quotes: Dict[str, Quote] = {}
+            placed_symbols: Set[str] = set()
+            if buy_candidates:
+                buy_quotes = self.buy_data.get_quotes(buy_candidates)
+                placed_symbols = self._place_buys(buy_candidates, buy_quotes)
 
-        if not combined_quotes:
-            return
+            fill_quotes: Dict[str, Quote] = {}
+            if open_order_symbols:
+                fill_quotes = self.fill_data.get_quotes(open_order_symbols)
 
-        current = now(self.settings.TIMEZONE)
-        # Use high-of-day for limit sells even premarket so we catch fills on HOD moves.
-        use_high_for_limits = True
-        fills = self.broker.simulate_minute(combined_quotes, use_high_for_limits=use_high_for_limits)
-        if fills:
-            self._process_fills(fills)
+            combined_quotes = dict(fill_quotes)
+            combined_quotes.update({sym: buy_quotes[sym] for sym in placed_symbols if sym in buy_quotes})
+
+            if not combined_quotes:
+                return
+
+            current = now(self.settings.TIMEZONE)
+            # Use high-of-day for limit sells even premarket so we catch fills on HOD moves.
+            use_high_for_limits = True
+            fills = self.broker.simulate_minute(combined_quotes, use_high_for_limits=use_high_for_limits)
+            if fills:
+                self._process_fills(fills)
+                self.pnl_logger.flush()
 
     def _place_buys(self, buy_candidates: List[str], quotes: Dict[str, Quote]) -> Set[str]:
-        placed_symbols: Set[str] = set()
+        orders: List[Order] = []
         for symbol in buy_candidates:
             quote = quotes.get(symbol)
             if not quote:
                 self.logger.debug("No buy quote for %s; skipping buy decision", symbol)
                 continue
             shares = max(1, math.ceil(self.settings.BASE_POSITION_DOLLARS / quote.last))
-            order = Order(
-                symbol=symbol,
-                side=OrderSide.BUY,
-                type=OrderType.MARKET,
-                quantity=shares,
-                status=OrderStatus.NEW,
-                tags=["entry"],
+            orders.append(
+                Order(
+                    symbol=symbol,
+                    side=OrderSide.BUY,
+                    type=OrderType.MARKET,
+                    quantity=shares,
+                    status=OrderStatus.NEW,
+                    tags=("entry",),
+                )
             )
-            placed = self.broker.place_order(order)
+
+        placed_symbols: Set[str] = set()
+        if not orders:
+            return placed_symbols
+        # Submit the whole tick's entries at once so real brokers can batch the round-trips.
+        for placed in self.broker.place_orders(orders):
             self.state_store.upsert_order(placed)
-            self.logger.info("Placed market buy for %s: %s shares", symbol, shares)
-            placed_symbols.add(symbol)
+            self.logger.info("Placed market buy for %s: %s shares", placed.symbol, placed.quantity)
+            placed_symbols.add(placed.symbol)
         return placed_symbols
 
     def _process_fills(self, fills: List[Fill]) -> None:
+        # Bind hot-path lookups once; fills can arrive in bursts on a single tick.
+        get_order = self.state_store.get_order
+        upsert_order = self.state_store.upsert_order
+        record_fill = self.state_store.record_fill
+        handlers = {
+            OrderSide.BUY: self._handle_buy_fill,
+            OrderSide.SELL: self._handle_sell_fill,
+        }
         for fill in fills:
-            order = self.state_store.get_order(fill.order_id)
-            if not order:
+            order = get_order(fill.order_id)
+            if order is None:
                 self.logger.warning("Fill for unknown order %s", fill.order_id)
                 continue
-            order.mark_status(OrderStatus.FILLED)
-            self.state_store.upsert_order(order)
-            self.state_store.record_fill(fill)
+            order = order.with_status(OrderStatus.FILLED)
+            upsert_order(order)
+            record_fill(fill)
             self.logger.info("Order %s filled for %s @ %.2f (%s shares)", order.id, order.symbol, fill.price, fill.quantity)
-            if order.side == OrderSide.BUY:
-                self._handle_buy_fill(order, fill)
-            else:
-                self._handle_sell_fill(order, fill)
+            handlers[order.side](order, fill)
 
     def _handle_buy_fill(self, order: Order, fill: Fill) -> None:
         position = self.state_store.positions.get(order.symbol)
@@ -164,19 +178,15 @@ class Strategy:
         """
         Create four staged target orders: +10%, +20%, +50%, +100%.
         """
-        first = math.floor(total_shares * 0.25)
-        second = math.floor(total_shares * 0.25)
-        third = math.floor(total_shares * 0.25)
-        fourth = total_shares - (first + second + third)
-        targets = [
-            ("target_10", entry_price * 1.10, first),
-            ("target_20", entry_price * 1.20, second),
-            ("target_50", entry_price * 1.50, third),
+        quarter = total_shares // 4
+        fourth = total_shares - 3 * quarter
+        targets = (
+            ("target_10", entry_price * 1.10, quarter),
+            ("target_20", entry_price * 1.20, quarter),
+            ("target_50", entry_price * 1.50, quarter),
             ("target_100", entry_price * 2.00, fourth),
-        ]
-        for tag, price, qty in targets:
-            if qty <= 0:
-                continue
+        )
+        for tag, price, qty in (target for target in targets if target[2] > 0):
             order = Order(
                 symbol=position.symbol,
                 side=OrderSide.SELL,
@@ -184,7 +194,7 @@ class Strategy:
                 price=price,
                 quantity=qty,
                 status=OrderStatus.NEW,
-                tags=[tag],
+                tags=(tag,),
             )
             placed = self.broker.place_order(order)
             position.open_target_orders.append(placed.id)
@@ -205,45 +215,43 @@ class Strategy:
         if self._eod_done_date == today:
             return
 
-        self.logger.info("EOD liquidation started")
-
-        # Cancel open target orders
-        for order in list(self.state_store.orders.values()):
-            if order.side == OrderSide.SELL and order.status in {OrderStatus.NEW, OrderStatus.WORKING}:
-                order.mark_status(OrderStatus.CANCELLED)
-                self.state_store.upsert_order(order)
-
-        positions = self.state_store.get_open_positions()
-        symbols_to_sell = [sym for sym, pos in positions.items() if pos.total_shares > 0]
-        if symbols_to_sell:
-            quotes = self.buy_data.get_quotes(symbols_to_sell)
-            for sym, pos in positions.items():
-                if pos.total_shares <= 0:
-                    continue
-                qty = pos.total_shares
-                order = Order(
-                    symbol=sym,
-                    side=OrderSide.SELL,
-                    type=OrderType.MARKET,
-                    quantity=qty,
-                    status=OrderStatus.NEW,
-                    tags=["eod_liquidation"],
-                )
-                placed = self.broker.place_order(order)
-                self.state_store.upsert_order(placed)
-                fill_quotes = {sym: quotes.get(sym)} if quotes.get(sym) else {}
-                fills = self.broker.simulate_minute(fill_quotes)
+        with self.state_store.batch():
+            self.logger.info("EOD liquidation started")
+
+            # Cancel open target orders
+            for order in self.state_store.get_open_orders(OrderSide.SELL):
+                self.state_store.upsert_order(order.with_status(OrderStatus.CANCELLED))
+
+            positions = self.state_store.get_open_positions()
+            active = [(sym, pos) for sym, pos in positions.items() if pos.total_shares > 0]
+            if active:
+                quotes = self.buy_data.get_quotes([sym for sym, _ in active])
+                orders = [
+                    Order(
+                        symbol=sym,
+                        side=OrderSide.SELL,
+                        type=OrderType.MARKET,
+                        quantity=pos.total_shares,
+                        status=OrderStatus.NEW,
+                        tags=("eod_liquidation",),
+                    )
+                    for sym, pos in active
+                ]
+                for placed in self.broker.place_orders(orders):
+                    self.state_store.upsert_order(placed)
+                fills = self.broker.simulate_minute(quotes)
                 self._process_fills(fills)
+                self.pnl_logger.flush()
 
-        # Mark positions closed
-        for pos in positions.values():
-            pos.closed = True
-            pos.open_target_orders.clear()
-            pos.total_shares = 0
-            self.state_store.upsert_position(pos)
+            # Mark positions closed
+            for pos in positions.values():
+                pos.closed = True
+                pos.open_target_orders.clear()
+                pos.total_shares = 0
+                self.state_store.upsert_position(pos)
 
-        if self.settings.EOD_CLEAR_STATE:
-            self.state_store.clear()
-            self.logger.info("State cleared after EOD liquidation")
+            if self.settings.EOD_CLEAR_STATE:
+                self.state_store.clear()
+                self.logger.info("State cleared after EOD liquidation")
 
-        self._eod_done_date = today
+            self._eod_done_date = today
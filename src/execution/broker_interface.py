@@ -17,6 +17,13 @@ class Broker(ABC):
     def place_order(self, order: Order) -> Order:
         ...
 
+    def place_orders(self, orders: List[Order]) -> List[Order]:
+        """
+        Submit several orders in one call. Brokers with a bulk or concurrent
+        submission path should override this; the default submits sequentially.
+        """
+        return [self.place_order(order) for order in orders]
+
     @abstractmethod
     def get_open_orders(self) -> List[Order]:
         ...
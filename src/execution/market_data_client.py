@@ -2,17 +2,38 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from src.brain.models import Quote
 from src.execution.broker_interface import MarketDataProvider
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 try:
     import yfinance as yf  # type: ignore
 except Exception:  # noqa: BLE001
     yf = None
 
 
+def _mount_pooled_adapter(session: requests.Session, pool_maxsize: int) -> None:
+    """
+    Mount a keep-alive pool with transparent 5xx retries (exponential backoff, honors Retry-After).
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
 class SyntheticMarketDataProvider(MarketDataProvider):
     """
     Deterministic synthetic quotes for local development. Prices vary slightly
@@ -23,27 +44,39 @@ class SyntheticMarketDataProvider(MarketDataProvider):
         self.base_price = base_price
         self.logger = logger or logging.getLogger(__name__)
 
-    def _price_for_symbol(self, symbol: str) -> float:
-        seed = sum(ord(c) for c in symbol)
-        minute = int(time.time() // 60)
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _price_minute(symbol: str, minute: int, base_price: float) -> float:
+        """
+        Price for a symbol in a given minute; memoized so repeat lookups within a minute are O(1).
+        """
+        seed = sum(map(ord, symbol))
         variation = ((minute + seed) % 5 - 2) * 0.01  # ±2% band
-        price = self.base_price + (seed % 10)
+        price = base_price + (seed % 10)
         return price * (1 + variation / 10)
 
+    def _price_for_symbol(self, symbol: str, minute: int | None = None) -> float:
+        if minute is None:
+            minute = int(time.time() // 60)
+        return self._price_minute(symbol, minute, self.base_price)
+
     def get_quotes(self, symbols: List[str]) -> Dict[str, Quote]:
         quotes: Dict[str, Quote] = {}
+        minute = int(time.time() // 60)
         for symbol in symbols:
-            last = self._price_for_symbol(symbol)
+            last = self._price_for_symbol(symbol, minute)
             bid = last * 0.999
             ask = last * 1.001
             quotes[symbol] = Quote(symbol=symbol, bid=bid, ask=ask, last=last)
-        self.logger.debug("Generated %d synthetic quotes", len(quotes))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Generated %d synthetic quotes", len(quotes))
         return quotes
 
 
 class FinnhubMarketDataProvider(MarketDataProvider):
     """
-    Finnhub real-time quote provider. Uses the /quote endpoint per symbol.
+    Finnhub real-time quote provider. Uses the /quote endpoint per symbol; requests
+    are paced on the calling thread and their round-trips overlap on a small pool.
     """
 
     def __init__(
@@ -54,21 +87,30 @@ class FinnhubMarketDataProvider(MarketDataProvider):
         delay_ms: int = 200,
         max_symbols_per_minute: int = 30,
         max_symbols_per_second: int = 5,
+        min_ttl_seconds: float = 2.0,
     ) -> None:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
         self.logger = logger or logging.getLogger(__name__)
         self.delay_ms = delay_ms
         self.max_symbols_per_minute = max_symbols_per_minute
         self.max_symbols_per_second = max_symbols_per_second
+        self.min_ttl_seconds = min_ttl_seconds
+        self._quote_cache: dict[str, tuple[float, Quote]] = {}
+        self.session = requests.Session()
+        # Size the pool for the concurrent fetches so keep-alive connections are reused.
+        _mount_pooled_adapter(self.session, max(10, max_symbols_per_second * 2))
+        self.session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
         self._offset = 0  # rotate symbols across ticks
-        self._window_start = time.time()
-        self._minute_key: int | None = None
-        self._used_in_window = 0
-        self._warned_window_start: float | None = None
+        # Token bucket for the per-minute cap: refills continuously, bursts up to one minute's budget.
+        self._tokens = float(max_symbols_per_minute)
+        self._refill_per_second = max_symbols_per_minute / 60.0
+        self._last_refill = time.monotonic()
+        self._last_cap_warn_minute: int | None = None
         self._last_trunc_warn_minute: int | None = None
-        self._recent_requests: list[float] = []
+        self._recent_requests: deque[float] = deque(maxlen=max_symbols_per_second)
+        # Long-lived worker pool reused across ticks, alongside the pooled session.
+        self._pool = ThreadPoolExecutor(max_workers=max_symbols_per_second, thread_name_prefix="finnhub")
 
     def _fetch_quote(self, symbol: str) -> Optional[Quote]:
         url = f"{self.base_url}/quote"
@@ -80,35 +122,35 @@ class FinnhubMarketDataProvider(MarketDataProvider):
             resp.raise_for_status()
             data = resp.json()
             # Finnhub fields: c=current, h=high, l=low, o=open, pc=prev close, t=timestamp, dp/per change fields may exist
-            bid = data.get("c") or 0.0
-            ask = data.get("c") or 0.0
-            last = data.get("c") or 0.0
-            high = data.get("h")
-            if last == 0:
+            current = data.get("c") or 0.0
+            if not current:
                 self.logger.warning("Finnhub returned zero quote for %s: %s", symbol, data)
                 return None
-            return Quote(symbol=symbol, bid=bid, ask=ask, last=last, high=high if high is not None else None)
+            return Quote(symbol=symbol, bid=current, ask=current, last=current, high=data.get("h"))
         except Exception as exc:  # noqa: BLE001
             self.logger.warning("Finnhub quote failed for %s: %s", symbol, exc)
             return None
 
     def _respect_rate_limits(self, allow: int) -> int:
-        now_ts = time.time()
-        minute_key = int(now_ts // 60)
-        # Reset window when clock minute changes, so each wall-clock minute gets a fresh budget.
-        if self._minute_key != minute_key:
-            self._minute_key = minute_key
-            self._window_start = now_ts
-            self._used_in_window = 0
-            self._warned_window_start = None
-        remaining_minute = max(0, self.max_symbols_per_minute - self._used_in_window)
-        allowed = min(allow, remaining_minute)
-        return allowed
+        """
+        Grant up to `allow` requests from the token bucket and deduct them.
+        """
+        now_mono = time.monotonic()
+        self._tokens = min(
+            float(self.max_symbols_per_minute),
+            self._tokens + (now_mono - self._last_refill) * self._refill_per_second,
+        )
+        self._last_refill = now_mono
+        granted = int(min(allow, self._tokens))
+        self._tokens -= granted
+        return granted
 
     def _sleep_for_per_second_limit(self) -> None:
         now_ts = time.time()
-        # Drop entries older than 1 second
-        self._recent_requests = [t for t in self._recent_requests if now_ts - t < 1]
+        # Drop entries older than 1 second in place; the deque is capped at the per-second limit.
+        recent = self._recent_requests
+        while recent and now_ts - recent[0] >= 1:
+            recent.popleft()
         if len(self._recent_requests) >= self.max_symbols_per_second:
             sleep_time = 1 - (now_ts - self._recent_requests[0])
             if sleep_time > 0:
@@ -117,28 +159,38 @@ class FinnhubMarketDataProvider(MarketDataProvider):
     def get_quotes(self, symbols: List[str]) -> Dict[str, Quote]:
         if not symbols:
             return {}
-        # Deduplicate and limit symbols per minute; rotate across ticks to cover all.
-        unique_symbols = list(dict.fromkeys(symbols))
+        now_ts = time.time()
+        minute_key = int(now_ts // 60)
+        # Serve recently fetched quotes from cache; only misses count against the budget.
+        quotes: Dict[str, Quote] = {}
+        unique_symbols: List[str] = []
+        for sym in dict.fromkeys(symbols):
+            cached = self._quote_cache.get(sym)
+            if cached is not None and now_ts - cached[0] < self.min_ttl_seconds:
+                quotes[sym] = cached[1]
+            else:
+                unique_symbols.append(sym)
+        if not unique_symbols:
+            return quotes
+
+        # Limit symbols per minute; rotate across ticks to cover all.
         allowed = self._respect_rate_limits(len(unique_symbols))
         if allowed <= 0:
-            if self._warned_window_start != self._window_start:
+            if self._last_cap_warn_minute != minute_key:
                 self.logger.warning(
                     "Finnhub per-minute cap reached (%d); skipping quotes for %d symbols.",
                     self.max_symbols_per_minute,
                     len(unique_symbols),
                 )
-                self._warned_window_start = self._window_start
-            return {}
+                self._last_cap_warn_minute = minute_key
+            return quotes
 
         if allowed < len(unique_symbols):
-            start = self._offset % len(unique_symbols)
-            end = start + allowed
-            if end <= len(unique_symbols):
-                selected = unique_symbols[start:end]
-            else:
-                selected = unique_symbols[start:] + unique_symbols[: end - len(unique_symbols)]
-            self._offset = (start + allowed) % len(unique_symbols)
-            minute_key = int(time.time() // 60)
+            count = len(unique_symbols)
+            start = self._offset % count
+            # Walk the ring by index so wraparound needs no slice copies or concatenation.
+            selected = [unique_symbols[(start + i) % count] for i in range(allowed)]
+            self._offset = (start + allowed) % count
             if self._last_trunc_warn_minute != minute_key:
                 self.logger.warning(
                     "Finnhub symbol list truncated to %d (of %d) this tick to respect rate limits.",
@@ -149,21 +201,28 @@ class FinnhubMarketDataProvider(MarketDataProvider):
         else:
             selected = unique_symbols
 
-        quotes: Dict[str, Quote] = {}
+        pending: Dict[str, Future] = {}
         for idx, sym in enumerate(selected):
             self._sleep_for_per_second_limit()
-            start = time.time()
-            q = self._fetch_quote(sym)
-            self._used_in_window += 1
-            self._recent_requests.append(start)
-            if q:
-                quotes[sym] = q
-            # Throttle between requests to respect rate limits.
+            self._recent_requests.append(time.time())
+            pending[sym] = self._pool.submit(self._fetch_quote, sym)
+            # Throttle between submissions to respect rate limits; responses overlap.
             if idx < len(selected) - 1 and self.delay_ms > 0:
                 time.sleep(self.delay_ms / 1000.0)
-        self.logger.debug("Fetched %d/%d quotes from Finnhub", len(quotes), len(selected))
+        fetched_at = time.time()
+        for sym, future in pending.items():
+            q = future.result()
+            if q:
+                quotes[sym] = q
+                self._quote_cache[sym] = (fetched_at, q)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Fetched %d/%d quotes from Finnhub", len(quotes), len(selected))
         return quotes
 
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+        self.session.close()
+
 
 class YFinanceMarketDataProvider(MarketDataProvider):
     """
@@ -172,55 +231,97 @@ class YFinanceMarketDataProvider(MarketDataProvider):
     reduce 429s by setting a browser-y User-Agent.
     """
 
-    def __init__(self, ttl_seconds: int = 300, logger: logging.Logger | None = None) -> None:
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        logger: logging.Logger | None = None,
+        ttl_map: Dict[str, int] | None = None,
+    ) -> None:
         if yf is None:
             raise ImportError("yfinance is required for YFinanceMarketDataProvider; please pip install yfinance")
         self.logger = logger or logging.getLogger(__name__)
         self.ttl_seconds = ttl_seconds
+        self.ttl_map: Dict[str, int] = dict(ttl_map or {})  # per-symbol overrides, e.g. shorter for volatile names
         self._cache: dict[str, tuple[float, Quote]] = {}
         self._session = requests.Session()
+        _mount_pooled_adapter(self._session, 10)
         self._session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:128.0) Gecko/20100101 Firefox/128.0",
                 "Accept": "application/json,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Encoding": "gzip",
+                "Connection": "keep-alive",
             }
         )
 
-    def _is_fresh(self, symbol: str) -> bool:
-        if symbol not in self._cache:
+    def _is_fresh(self, symbol: str, now_ts: float) -> bool:
+        entry = self._cache.get(symbol)
+        if entry is None:
             return False
-        ts, _ = self._cache[symbol]
-        return (time.time() - ts) < self.ttl_seconds
+        return (now_ts - entry[0]) < self.ttl_map.get(symbol, self.ttl_seconds)
+
+    def _quote_from_bars(self, symbol: str, bars) -> Optional[Quote]:
+        bars = bars.dropna(subset=["Close"])
+        if bars.empty:
+            return None
+        last_row = bars.iloc[-1]
+        high = float(last_row.get("High", 0.0))
+        close = float(last_row.get("Close", 0.0))
+        if close == 0.0:
+            return None
+        return Quote(symbol=symbol, bid=close, ask=close, last=close, mid=close, high=high)
 
-    def _fetch_symbol(self, symbol: str) -> Optional[Quote]:
+    def _fetch_batch(self, symbols: List[str]) -> Dict[str, Quote]:
+        """
+        Download 5m bars for all symbols in one yfinance request and fan out into quotes.
+        """
         try:
-            data = yf.Ticker(symbol, session=self._session)
-            hist = data.history(period="1d", interval="5m")
-            if hist.empty:
-                return None
-            last_row = hist.iloc[-1]
-            high = float(last_row.get("High", 0.0))
-            close = float(last_row.get("Close", 0.0))
-            if close == 0.0:
-                return None
-            quote = Quote(symbol=symbol, bid=close, ask=close, last=close, mid=close, high=high)
-            return quote
+            frame = yf.download(
+                symbols,
+                period="1d",
+                interval="5m",
+                group_by="ticker",
+                threads=True,
+                progress=False,
+                session=self._session,
+            )
         except Exception as exc:  # noqa: BLE001
             # Suppress noisy repeats; log at debug to avoid spamming.
-            self.logger.debug("yfinance quote failed for %s: %s", symbol, exc)
-            return None
+            self.logger.debug("yfinance batch download failed for %d symbols: %s", len(symbols), exc)
+            return {}
+        if frame is None or frame.empty:
+            return {}
 
-    def get_quotes(self, symbols: List[str]) -> Dict[str, Quote]:
         quotes: Dict[str, Quote] = {}
-        unique_symbols = list(dict.fromkeys(symbols))
-        for sym in unique_symbols:
-            if self._is_fresh(sym):
-                quotes[sym] = self._cache[sym][1]
+        grouped = frame.columns.nlevels > 1
+        tickers = set(frame.columns.get_level_values(0)) if grouped else set(symbols)
+        for sym in symbols:
+            if sym not in tickers:
+                continue
+            try:
+                q = self._quote_from_bars(sym, frame[sym] if grouped else frame)
+            except Exception as exc:  # noqa: BLE001
+                self.logger.debug("yfinance quote failed for %s: %s", sym, exc)
                 continue
-            q = self._fetch_symbol(sym)
             if q:
                 quotes[sym] = q
-                self._cache[sym] = (time.time(), q)
+        return quotes
+
+    def get_quotes(self, symbols: List[str]) -> Dict[str, Quote]:
+        quotes: Dict[str, Quote] = {}
+        stale: List[str] = []
+        now_ts = time.time()
+        for sym in dict.fromkeys(symbols):
+            if self._is_fresh(sym, now_ts):
+                quotes[sym] = self._cache[sym][1]
+            else:
+                stale.append(sym)
+        if stale:
+            fetched = self._fetch_batch(stale)
+            fetched_at = time.time()
+            for sym, q in fetched.items():
+                self._cache[sym] = (fetched_at, q)
+            quotes.update(fetched)
         return quotes
 
 
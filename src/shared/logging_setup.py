@@ -1,17 +1,90 @@
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
 
+class BatchingTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """
+    Daily rotating file handler that flushes every `flush_every` records or
+    `flush_interval` seconds after the first unflushed record, instead of after
+    every record. A timer covers the idle tail; rollover and close always flush.
+    """
+
+    def __init__(self, *args, flush_every: int = 64, flush_interval: float = 0.1, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._pending = 0
+        self._timer: Optional[threading.Timer] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Same as BaseRotatingHandler/StreamHandler.emit minus the per-record flush.
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._flush_now()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _flush_on_timer(self) -> None:
+        self.acquire()
+        try:
+            if self._timer is threading.current_thread():  # not superseded by a newer timer
+                self._timer = None
+            self._flush_now()
+        finally:
+            self.release()
+
+    def _flush_now(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            self.flush()
+            self._pending = 0
+
+    def doRollover(self) -> None:
+        self._flush_now()
+        super().doRollover()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            self._flush_now()
+        finally:
+            self.release()
+        super().close()
+
+
 def configure_logging(log_path: Optional[str] = None, level: int = logging.INFO) -> logging.Logger:
     """
     Configure application-wide logging with a daily rotating file handler and console output.
+    Records are handed to a background QueueListener so callers never block on file or console I/O.
     """
     logger = logging.getLogger("finviz_trader")
     if logger.handlers:
         return logger  # Already configured
 
+    # The formatter never prints thread/process fields, so skip collecting them on every record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     log_dir = Path(log_path).expanduser().parent if log_path else Path("logs")
     log_dir.mkdir(parents=True, exist_ok=True)
     file_path = Path(log_path) if log_path else log_dir / "finviz_trader.log"
@@ -22,7 +95,7 @@ def configure_logging(log_path: Optional[str] = None, level: int = logging.INFO)
     )
 
     # Rotate daily, keep all history (backupCount=0 means no deletion)
-    file_handler = TimedRotatingFileHandler(file_path, when="midnight", interval=1, backupCount=0, utc=False)
+    file_handler = BatchingTimedRotatingFileHandler(file_path, when="midnight", interval=1, backupCount=0, utc=False)
     file_handler.setFormatter(formatter)
     file_handler.setLevel(level)
 
@@ -30,9 +103,14 @@ def configure_logging(log_path: Optional[str] = None, level: int = logging.INFO)
     console_handler.setFormatter(formatter)
     console_handler.setLevel(level)
 
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # drain queued records before interpreter shutdown
+
     logger.setLevel(level)
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.listener = listener  # type: ignore[attr-defined]  # lets callers stop() it explicitly
     logger.propagate = False
     logger.debug("Logging configured")
     return logger
@@ -1,40 +1,142 @@
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import os
+import time
+from io import BufferedWriter
 from pathlib import Path
-from datetime import datetime, date
+from datetime import datetime, date, time as dt_time, timedelta, timezone
+
+from .time_utils import now
+
+try:
+    import orjson  # type: ignore  # optional speedup, not in requirements.txt
+except Exception:  # noqa: BLE001
+    orjson = None
+
+
+def _dumps_line(payload: dict) -> bytes:
+    """
+    Serialize one JSON line as bytes; orjson when available, compact stdlib json otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload) + b"\n"
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n"
 
 
 class PnLLogger:
     """
     Append-only JSON-lines logger for per-trade metrics.
-    Each line is a JSON object with an 'event' field.
+    Each line is a JSON object with an 'event' field. The current day is written to
+    `<stem>.log`, which is renamed to `<stem>-YYYY-MM-DD.log` when the date rolls.
+    The live file stays open with a 64KB buffer that is flushed every `flush_every`
+    events, after `flush_interval` seconds, on `flush()`, and on `close()` (registered at exit).
     """
 
-    def __init__(self, path: Path, logger: logging.Logger | None = None) -> None:
+    def __init__(
+        self,
+        path: Path,
+        logger: logging.Logger | None = None,
+        flush_every: int = 16,
+        flush_interval: float = 0.2,
+        tz: str | None = None,
+    ) -> None:
         self.base_dir = Path(path).expanduser().parent
         self.base_stem = Path(path).stem or "pnl"
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self.logger = logger or logging.getLogger(__name__)
-        self._current_date: date | None = None
-        self._current_path: Path | None = None
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.tz = tz  # trading-day timezone; None uses the host's local time
+        self.live_path = self.base_dir / f"{self.base_stem}.log"
+        self._open_date: date | None = None
+        self._today: date | None = None
+        self._next_midnight_mono = 0.0
+        self._fh: BufferedWriter | None = None
+        self._buf_count = 0
+        self._last_flush = time.monotonic()
+
+    def _dated_path(self, day: date) -> Path:
+        return self.base_dir / f"{self.base_stem}-{day.isoformat()}.log"
 
-    def _path_for_today(self) -> Path:
-        today = date.today()
-        if self._current_date != today or self._current_path is None:
-            self._current_date = today
-            self._current_path = self.base_dir / f"{self.base_stem}-{today.isoformat()}.log"
-        return self._current_path
+    def _rotate(self, today: date) -> None:
+        """
+        Close the live file and archive it under the day it was written, if that is not today.
+        """
+        self.close()
+        if self.live_path.exists():
+            written = self._open_date or self._date_of(self.live_path.stat().st_mtime)
+            if written != today:
+                dated = self._dated_path(written)
+                if dated.exists():
+                    # Already archived once for that day (e.g. after a restart); append rather than clobber.
+                    with dated.open("ab") as archive:
+                        archive.write(self.live_path.read_bytes())
+                    self.live_path.unlink()
+                else:
+                    os.rename(self.live_path, dated)
+        self._open_date = today
+
+    def _date_of(self, timestamp: float) -> date:
+        if self.tz:
+            return datetime.fromtimestamp(timestamp, now(self.tz).tzinfo).date()
+        return date.fromtimestamp(timestamp)
+
+    def _refresh_today(self) -> None:
+        """
+        Recompute today's date and the monotonic deadline of the next midnight in `tz`.
+        """
+        if self.tz:
+            current = now(self.tz)
+            next_midnight = datetime.combine(current.date() + timedelta(days=1), dt_time(), tzinfo=current.tzinfo)
+        else:
+            current = datetime.now().astimezone()
+            next_midnight = datetime.combine(current.date() + timedelta(days=1), dt_time()).astimezone()
+        remaining = (next_midnight.astimezone(timezone.utc) - current.astimezone(timezone.utc)).total_seconds()
+        self._today = current.date()
+        self._next_midnight_mono = time.monotonic() + max(remaining, 0.0)
+
+    def _handle(self) -> BufferedWriter:
+        # Only consult the wall clock once the cached midnight deadline has passed.
+        if time.monotonic() >= self._next_midnight_mono:
+            self._refresh_today()
+        if self._open_date != self._today:
+            self._rotate(self._today)
+        if self._fh is None:
+            self._fh = open(self.live_path, "ab", buffering=65536)
+            atexit.register(self.close)  # only while a handle is open, so idle loggers are not pinned
+        return self._fh
 
     def _write(self, payload: dict) -> None:
         try:
-            path = self._path_for_today()
-            with path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(payload) + "\n")
+            fh = self._handle()
+            fh.write(_dumps_line(payload))
+            self._buf_count += 1
+            if self._buf_count >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
         except Exception as exc:  # noqa: BLE001
             self.logger.debug("PnL log write failed: %s", exc)
 
+    def flush(self) -> None:
+        if self._fh is not None and self._buf_count:
+            self._fh.flush()
+        self._buf_count = 0
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self._fh is None:
+            return
+        try:
+            self.flush()
+            self._fh.close()
+        except Exception as exc:  # noqa: BLE001
+            self.logger.debug("PnL log close failed: %s", exc)
+        finally:
+            self._fh = None
+            atexit.unregister(self.close)
+
     def log_entry(self, symbol: str, ts: datetime, price: float, qty: int, order_id: str) -> None:
         self._write(
             {
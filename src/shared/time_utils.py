@@ -1,12 +1,28 @@
 from __future__ import annotations
 
 import datetime as dt
+from functools import lru_cache
 from zoneinfo import ZoneInfo
-from typing import Optional
+from typing import Callable, Optional
+
+
+@lru_cache(maxsize=16)
+def _zone(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+def _key(t: dt.time | dt.datetime) -> int:
+    """
+    Microseconds since midnight, so session bounds compare as plain ints.
+    """
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+
+
+_time_key = lru_cache(maxsize=64)(_key)  # session bounds repeat; per-tick datetimes never do
 
 
 def now(tz: str | ZoneInfo = "America/New_York") -> dt.datetime:
-    zone = ZoneInfo(tz) if isinstance(tz, str) else tz
+    zone = _zone(tz) if isinstance(tz, str) else tz
     return dt.datetime.now(zone)
 
 
@@ -24,5 +40,28 @@ def is_within_trading_hours(
         return False
     if not allow_weekends and current.weekday() >= 5:  # 5=Saturday, 6=Sunday
         return False
-    current_time = current.time()
-    return premarket_start <= current_time <= regular_close
+    current_key = _key(current)
+    return _time_key(premarket_start) <= current_key <= _time_key(regular_close)
+
+
+def make_session_check(
+    premarket_start: dt.time,
+    regular_close: dt.time,
+    allow_weekends: bool = False,
+) -> Callable[[Optional[dt.datetime]], bool]:
+    """
+    Build a predicate equivalent to `is_within_trading_hours` with the bounds pre-converted,
+    for callers that check the same window every tick.
+    """
+    lower = _time_key(premarket_start)
+    upper = _time_key(regular_close)
+
+    def in_session(current: Optional[dt.datetime]) -> bool:
+        if current is None:
+            return False
+        if not allow_weekends and current.weekday() >= 5:
+            return False
+        current_key = _key(current)
+        return lower <= current_key <= upper
+
+    return in_session
@@ -11,16 +11,21 @@ Usage examples:
 import argparse
 import datetime as dt
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 from src.brain.config import Settings
 from src.brain.state_store import JsonStateStore
 from src.shared.time_utils import now
 from src.shared.logging_setup import configure_logging
 
+FINNHUB_BASE_URL = "https://finnhub.io/api/v1"
+MAX_WORKERS = 8
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Fetch intraday high-of-day for symbols.")
@@ -46,49 +51,38 @@ def load_symbols(args: argparse.Namespace, state_path) -> List[str]:
     return sorted(store.positions.keys())
 
 
-def get_intraday_high(
+def _quote_hod(symbol: str, settings: Settings, logger, session: requests.Session) -> Optional[float]:
+    """
+    High-of-day from Finnhub /quote. Raises on HTTP errors; returns None when no HOD is reported.
+    """
+    resp = session.get(f"{FINNHUB_BASE_URL}/quote", params={"symbol": symbol, "token": settings.FINNHUB_API_KEY}, timeout=10)
+    if resp.status_code != 200:
+        logger.warning("Finnhub quote error %s for %s: %s", resp.status_code, symbol, resp.text[:200])
+        resp.raise_for_status()
+    hod = resp.json().get("h")
+    return float(hod) if hod is not None and hod > 0 else None
+
+
+def _candle_hod(
     symbol: str,
     settings: Settings,
     logger,
     session: requests.Session,
     resolution: str = "5",
-    use_candle: bool = False,
 ) -> Optional[float]:
     """
-    Prefer Finnhub /quote high-of-day (works on free tiers). If explicitly requested,
-    fall back to candle endpoint.
+    High-of-day from today's Finnhub candles (may be restricted on free plans).
     """
-    base = "https://finnhub.io/api/v1"
-
-    # First try /quote for HOD
-    try:
-        resp = session.get(f"{base}/quote", params={"symbol": symbol, "token": settings.FINNHUB_API_KEY}, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            hod = data.get("h")
-            if hod is not None and hod > 0:
-                return float(hod)
-        else:
-            logger.warning("Finnhub quote error %s for %s: %s", resp.status_code, symbol, resp.text[:200])
-            resp.raise_for_status()
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("Finnhub quote failed for %s: %s", symbol, exc)
-
-    if not use_candle:
-        return None
-
-    # Optional candle path (may be restricted on free plans).
-    end = int(now(settings.TIMEZONE).timestamp())
-    start_of_day = now(settings.TIMEZONE).replace(hour=0, minute=0, second=0, microsecond=0)
-    start = int(start_of_day.timestamp())
+    current = now(settings.TIMEZONE)
+    start_of_day = current.replace(hour=0, minute=0, second=0, microsecond=0)
     params = {
         "symbol": symbol,
         "resolution": resolution,
-        "from": start,
-        "to": end,
+        "from": int(start_of_day.timestamp()),
+        "to": int(current.timestamp()),
         "token": settings.FINNHUB_API_KEY,
     }
-    resp = session.get(f"{base}/stock/candle", params=params, timeout=10)
+    resp = session.get(f"{FINNHUB_BASE_URL}/stock/candle", params=params, timeout=10)
     if resp.status_code != 200:
         logger.warning(
             "Finnhub candle error %s for %s (resolution=%s): %s",
@@ -106,20 +100,51 @@ def get_intraday_high(
     return max(highs) if highs else None
 
 
+def get_intraday_high(
+    symbol: str,
+    settings: Settings,
+    logger,
+    session: requests.Session,
+    resolution: str = "5",
+    use_candle: bool = False,
+) -> Optional[float]:
+    """
+    Prefer Finnhub /quote high-of-day (works on free tiers). If explicitly requested,
+    fall back to candle endpoint. Without the fallback, /quote errors propagate to the caller.
+    """
+    if not use_candle:
+        return _quote_hod(symbol, settings, logger, session)
+    try:
+        hod = _quote_hod(symbol, settings, logger, session)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Finnhub quote failed for %s: %s", symbol, exc)
+        hod = None
+    if hod is not None:
+        return hod
+    return _candle_hod(symbol, settings, logger, session, resolution)
+
+
 def main() -> None:
     load_dotenv()
     settings = Settings()
     logger = configure_logging(str(settings.LOG_FILE))
     args = parse_args()
     session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=MAX_WORKERS))
     symbols = load_symbols(args, settings.STATE_FILE)
     if not symbols:
         print("No symbols provided or found in state.")
         sys.exit(0)
     print(f"Fetching intraday highs (resolution {args.resolution}) for: {', '.join(symbols)}")
-    for sym in symbols:
+    # Fetch concurrently, then print in the original symbol order.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {
+            sym: pool.submit(get_intraday_high, sym, settings, logger, session, args.resolution, False)
+            for sym in symbols
+        }
+    for sym, future in futures.items():
         try:
-            high = get_intraday_high(sym, settings, logger, session, resolution=args.resolution, use_candle=False)
+            high = future.result()
             if high is None:
                 print(f"{sym}: no data")
             else:
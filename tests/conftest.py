@@ -0,0 +1,16 @@
+import pytest
+
+from src.execution.market_data_client import SyntheticMarketDataProvider
+from src.execution.paper_broker import PaperBroker
+
+
+@pytest.fixture(scope="session")
+def synthetic_market_data():
+    # Stateless apart from its memoized prices, so one instance can serve every test.
+    return SyntheticMarketDataProvider()
+
+
+@pytest.fixture
+def paper_broker(synthetic_market_data):
+    # The broker holds the order book, so each test gets a fresh one.
+    return PaperBroker(market_data=synthetic_market_data)
@@ -30,7 +30,7 @@ class StubMarketData(MarketDataProvider):
 
 def test_strategy_places_buys_and_targets(tmp_path):
     state_file = Path(tmp_path) / "state.json"
-    settings = Settings(STATE_FILE=state_file, BASE_POSITION_DOLLARS=1000.0)
+    settings = Settings(STATE_FILE=state_file, PNL_LOG_FILE=Path(tmp_path) / "pnl.log", BASE_POSITION_DOLLARS=1000.0)
     screener = StubScreener(["ABC"])
     market_data = StubMarketData({"ABC": 50.0})
     broker = PaperBroker(market_data=market_data)
@@ -51,3 +51,22 @@ def test_strategy_places_buys_and_targets(tmp_path):
     assert len(sell_orders) == 4
     assert sum(o.quantity for o in sell_orders) == position.total_shares
     assert set(position.open_target_orders) == {o.id for o in sell_orders}
+
+
+def test_eod_liquidation_cancels_targets_and_flattens(tmp_path):
+    state_file = Path(tmp_path) / "state.json"
+    settings = Settings(STATE_FILE=state_file, PNL_LOG_FILE=Path(tmp_path) / "pnl.log", BASE_POSITION_DOLLARS=1000.0, EOD_CLEAR_STATE=False)
+    screener = StubScreener(["ABC"])
+    market_data = StubMarketData({"ABC": 50.0})
+    broker = PaperBroker(market_data=market_data)
+    store = JsonStateStore(state_file)
+    strategy = Strategy(settings, screener, market_data, market_data, broker, store)
+
+    strategy.run_tick()
+    strategy.run_eod_liquidation()
+
+    targets = [o for o in store.orders.values() if o.side == OrderSide.SELL and "eod_liquidation" not in o.tags]
+    assert targets and all(o.status == OrderStatus.CANCELLED for o in targets)
+    assert store.get_open_orders() == []
+    assert store.positions["ABC"].closed
+    assert store.positions["ABC"].total_shares == 0
@@ -0,0 +1,36 @@
+import logging
+import time
+from pathlib import Path
+
+from src.shared.logging_setup import BatchingTimedRotatingFileHandler
+
+
+def _record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 0, msg, None, None)
+
+
+def _lines(path: Path):
+    return path.read_text().splitlines() if path.exists() else []
+
+
+def test_batching_handler_flushes_on_count_and_idle_timer(tmp_path):
+    log_file = Path(tmp_path) / "app.log"
+    handler = BatchingTimedRotatingFileHandler(log_file, when="midnight", flush_every=3, flush_interval=0.05)
+    try:
+        handler.handle(_record("a"))
+        handler.handle(_record("b"))
+        assert _lines(log_file) == []
+
+        handler.handle(_record("c"))
+        assert _lines(log_file) == ["a", "b", "c"]
+
+        handler.handle(_record("d"))  # idle tail: only the timer can flush this one
+        deadline = time.monotonic() + 2.0
+        while _lines(log_file) != ["a", "b", "c", "d"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _lines(log_file) == ["a", "b", "c", "d"]
+
+        handler.handle(_record("e"))
+    finally:
+        handler.close()
+    assert _lines(log_file) == ["a", "b", "c", "d", "e"]
@@ -0,0 +1,127 @@
+import math
+
+import pandas as pd
+import pytest
+
+from src.execution.market_data_client import FinnhubMarketDataProvider, YFinanceMarketDataProvider
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    def __init__(self, prices):
+        self.prices = prices
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(params["symbol"])
+        price = self.prices[params["symbol"]]
+        return FakeResponse({"c": price, "h": price * 1.05})
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def make_finnhub():
+    providers = []
+
+    def _make(**kwargs):
+        provider = FinnhubMarketDataProvider(api_key="test", delay_ms=0, **kwargs)
+        providers.append(provider)
+        return provider
+
+    yield _make
+    for provider in providers:
+        provider.close()
+
+
+def test_finnhub_get_quotes_respects_minute_cap(make_finnhub):
+    provider = make_finnhub(max_symbols_per_minute=2)
+    provider.session = FakeSession({"AAA": 10.0, "BBB": 20.0, "CCC": 30.0})
+
+    quotes = provider.get_quotes(["AAA", "BBB", "CCC", "AAA"])
+
+    assert list(quotes) == ["AAA", "BBB"]
+    assert quotes["BBB"].last == 20.0
+    assert quotes["BBB"].high == 21.0
+    assert provider.get_quotes(["CCC"]) == {}
+    assert sorted(provider.session.calls) == ["AAA", "BBB"]
+
+
+def test_finnhub_token_bucket_refills_over_time(monkeypatch, make_finnhub):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr("src.execution.market_data_client.time.monotonic", lambda: clock["now"])
+    provider = make_finnhub(max_symbols_per_minute=60)
+
+    assert provider._respect_rate_limits(100) == 60
+    assert provider._respect_rate_limits(1) == 0
+    clock["now"] += 5.0
+    assert provider._respect_rate_limits(100) == 5
+    clock["now"] += 600.0
+    assert provider._respect_rate_limits(100) == 60
+
+
+def test_finnhub_serves_recent_quotes_from_cache(make_finnhub):
+    provider = make_finnhub(max_symbols_per_minute=2, min_ttl_seconds=60)
+    provider.session = FakeSession({"AAA": 10.0, "BBB": 20.0})
+
+    provider.get_quotes(["AAA"])
+    quotes = provider.get_quotes(["AAA", "BBB"])
+
+    assert set(quotes) == {"AAA", "BBB"}
+    assert provider.session.calls == ["AAA", "BBB"]
+    # The cache hit did not consume budget, and with the bucket now empty cached quotes are still served.
+    assert set(provider.get_quotes(["AAA", "BBB", "CCC"])) == {"AAA", "BBB"}
+
+
+def test_finnhub_rotates_truncated_symbol_list(make_finnhub):
+    provider = make_finnhub(max_symbols_per_second=10, min_ttl_seconds=0)  # per-second limit never sleeps here
+    provider.session = FakeSession({"AAA": 1.0, "BBB": 2.0, "CCC": 3.0})
+    provider._respect_rate_limits = lambda allow: min(allow, 2)
+
+    assert list(provider.get_quotes(["AAA", "BBB", "CCC"])) == ["AAA", "BBB"]
+    assert list(provider.get_quotes(["AAA", "BBB", "CCC"])) == ["CCC", "AAA"]
+    assert list(provider.get_quotes(["AAA", "BBB", "CCC"])) == ["BBB", "CCC"]
+
+
+def _yf_frame():
+    nan = math.nan
+    columns = pd.MultiIndex.from_product([["AAA", "BBB", "CCC"], ["High", "Close"]])
+    rows = [
+        [10.5, 10.0, 21.0, 20.0, nan, nan],
+        [11.0, 10.8, 22.0, nan, nan, nan],  # BBB's last bar has no close yet
+    ]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def test_yfinance_batch_fans_out_and_caches(monkeypatch):
+    downloads = []
+
+    def fake_download(symbols, **kwargs):
+        downloads.append(list(symbols))
+        return _yf_frame()
+
+    monkeypatch.setattr("src.execution.market_data_client.yf.download", fake_download)
+    provider = YFinanceMarketDataProvider(ttl_seconds=60)
+
+    quotes = provider.get_quotes(["AAA", "BBB", "CCC"])
+
+    assert set(quotes) == {"AAA", "BBB"}  # CCC is all-NaN
+    assert (quotes["AAA"].last, quotes["AAA"].high) == (10.8, 11.0)
+    assert (quotes["BBB"].last, quotes["BBB"].high) == (20.0, 21.0)
+    assert set(provider._cache) == {"AAA", "BBB"}
+
+    assert provider.get_quotes(["AAA", "BBB"]) == quotes
+    assert downloads == [["AAA", "BBB", "CCC"]]  # second call was served within the TTL
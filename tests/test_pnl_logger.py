@@ -0,0 +1,61 @@
+import datetime as dt
+import json
+from pathlib import Path
+
+from src.shared.pnl_logger import PnLLogger
+
+
+def _read_events(directory: Path):
+    return [json.loads(line) for path in sorted(directory.glob("pnl*.log")) for line in path.read_text().splitlines()]
+
+
+def test_pnl_logger_buffers_until_flush(tmp_path):
+    pnl = PnLLogger(Path(tmp_path) / "pnl.log", flush_every=16, flush_interval=3600)
+    ts = dt.datetime(2024, 1, 2, 10, 0, tzinfo=dt.timezone.utc)
+
+    pnl.log_entry("ABC", ts, 10.0, 5, "o1")
+    pnl.log_exit_fill("ABC", ts, 11.0, 5, 5.0, "o2")
+    assert _read_events(Path(tmp_path)) == []
+
+    pnl.flush()
+    assert [e["event"] for e in _read_events(Path(tmp_path))] == ["entry", "exit_fill"]
+
+    pnl.log_close_summary("ABC", ts, 5.0)
+    pnl.close()
+    assert _read_events(Path(tmp_path))[-1] == {
+        "event": "close",
+        "symbol": "ABC",
+        "timestamp": ts.isoformat(),
+        "realized_pnl": 5.0,
+    }
+
+
+def test_pnl_logger_archives_live_file_on_day_roll(tmp_path):
+    pnl = PnLLogger(Path(tmp_path) / "pnl.log")
+    ts = dt.datetime(2024, 1, 2, 10, 0, tzinfo=dt.timezone.utc)
+    pnl.log_entry("ABC", ts, 10.0, 5, "o1")
+    yesterday = pnl._today - dt.timedelta(days=1)
+    pnl._open_date = yesterday  # pretend the live file was opened yesterday
+    pnl._next_midnight_mono = 0.0  # and that midnight has since passed
+
+    pnl.log_entry("XYZ", ts, 20.0, 5, "o2")
+    pnl.close()
+
+    archived = Path(tmp_path) / f"pnl-{yesterday.isoformat()}.log"
+    assert [json.loads(line)["symbol"] for line in archived.read_text().splitlines()] == ["ABC"]
+    live = Path(tmp_path) / "pnl.log"
+    assert [json.loads(line)["symbol"] for line in live.read_text().splitlines()] == ["XYZ"]
+
+
+def test_pnl_logger_registers_atexit_only_while_open(tmp_path, monkeypatch):
+    registered = []
+    monkeypatch.setattr("src.shared.pnl_logger.atexit.register", registered.append)
+    monkeypatch.setattr("src.shared.pnl_logger.atexit.unregister", registered.remove)
+    pnl = PnLLogger(Path(tmp_path) / "pnl.log")
+    assert registered == []
+
+    pnl.log_entry("ABC", dt.datetime(2024, 1, 2, 10, 0, tzinfo=dt.timezone.utc), 10.0, 5, "o1")
+    assert registered == [pnl.close]
+
+    pnl.close()
+    assert registered == []
@@ -0,0 +1,48 @@
+import json
+from pathlib import Path
+
+from src.brain.models import Order, OrderSide, OrderStatus, OrderType
+from src.brain.state_store import JsonStateStore
+
+
+def test_batch_defers_persistence_until_exit(tmp_path):
+    state_file = Path(tmp_path) / "state.json"
+    store = JsonStateStore(state_file)
+    order = Order(symbol="ABC", side=OrderSide.BUY, type=OrderType.MARKET, quantity=5)
+
+    with store.batch():
+        store.upsert_order(order)
+        assert json.loads(state_file.read_text())["orders"] == {}
+
+    assert order.id in json.loads(state_file.read_text())["orders"]
+    reloaded = JsonStateStore(state_file)
+    assert [o.id for o in reloaded.get_open_orders()] == [order.id]
+
+
+def test_open_order_index_tracks_status(tmp_path):
+    store = JsonStateStore(Path(tmp_path) / "state.json")
+    order = Order(symbol="ABC", side=OrderSide.SELL, type=OrderType.LIMIT, price=11.0, quantity=5)
+    store.upsert_order(order)
+    assert store.get_open_orders(OrderSide.SELL) == [order]
+    assert store.get_open_orders(OrderSide.BUY) == []
+
+    store.upsert_order(order.with_status(OrderStatus.FILLED))
+    assert store.get_open_orders() == []
+
+
+def test_open_orders_come_back_in_insertion_order(tmp_path):
+    state_file = Path(tmp_path) / "state.json"
+    store = JsonStateStore(state_file)
+    orders = [
+        Order(symbol=f"S{i:02d}", side=OrderSide.SELL, type=OrderType.LIMIT, price=10.0, quantity=1)
+        for i in range(12)
+    ]
+    with store.batch():
+        for order in orders:
+            store.upsert_order(order)
+        store.upsert_order(orders[3].with_status(OrderStatus.FILLED))
+        store.upsert_order(orders[5].with_status(OrderStatus.WORKING))  # re-upsert keeps its slot
+
+    expected = [o.symbol for i, o in enumerate(orders) if i != 3]
+    assert [o.symbol for o in store.get_open_orders()] == expected
+    assert [o.symbol for o in JsonStateStore(state_file).get_open_orders()] == expected
@@ -0,0 +1,36 @@
+import datetime as dt
+
+from src.shared.time_utils import is_within_trading_hours, make_session_check
+
+PREMARKET = dt.time(4, 0)
+OPEN = dt.time(9, 30)
+CLOSE = dt.time(16, 0)
+
+
+def test_trading_hours_bounds_are_inclusive_to_the_microsecond():
+    day = dt.date(2024, 1, 3)  # Wednesday
+    at = lambda t: dt.datetime.combine(day, t)  # noqa: E731
+    assert not is_within_trading_hours(at(dt.time(3, 59, 59)), PREMARKET, OPEN, CLOSE)
+    assert is_within_trading_hours(at(PREMARKET), PREMARKET, OPEN, CLOSE)
+    assert is_within_trading_hours(at(CLOSE), PREMARKET, OPEN, CLOSE)
+    assert not is_within_trading_hours(at(dt.time(16, 0, 0, 1)), PREMARKET, OPEN, CLOSE)
+
+
+def test_trading_hours_weekend_gate():
+    saturday = dt.datetime(2024, 1, 6, 10, 0)
+    assert not is_within_trading_hours(saturday, PREMARKET, OPEN, CLOSE)
+    assert is_within_trading_hours(saturday, PREMARKET, OPEN, CLOSE, allow_weekends=True)
+    assert not is_within_trading_hours(None, PREMARKET, OPEN, CLOSE)
+
+
+def test_session_check_matches_is_within_trading_hours():
+    check = make_session_check(PREMARKET, CLOSE)
+    for current in (
+        dt.datetime(2024, 1, 3, 3, 59, 59),
+        dt.datetime(2024, 1, 3, 4, 0),
+        dt.datetime(2024, 1, 3, 16, 0),
+        dt.datetime(2024, 1, 3, 16, 0, 30),
+        dt.datetime(2024, 1, 6, 10, 0),
+        None,
+    ):
+        assert check(current) == is_within_trading_hours(current, PREMARKET, OPEN, CLOSE)